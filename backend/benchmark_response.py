@@ -0,0 +1,128 @@
+"""
+Compare encode time and payload size of the default FastAPI response path
+against fast_response.FastJSONResponse, using the sample shipments.
+
+Usage: python benchmark_response.py [sample1.json sample2.json ...]
+"""
+
+import json
+import sys
+import timeit
+import uuid
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from fast_response import brotli, compress, encode_json
+from main import ShipmentLayout
+from optimize_packaging import Optimizer, Block
+
+REPEAT = 5
+NUMBER = 20
+
+
+def build_shipment(sample):
+    """Build a stored shipment document the same way create-shipment does"""
+    container = sample["container"]
+    boxes = []
+    for box in sample["boxes"]:
+        box = dict(box)
+        box["box_id"] = f"BOX-{uuid.uuid4().hex[:8].upper()}"
+        boxes.append(box)
+
+    blocks = [
+        Block(
+            box["box_id"],
+            box["length"],
+            box["breadth"],
+            box["height"],
+            box["weight"],
+            box["customer_id"],
+            box["fragile"],
+        )
+        for box in boxes
+    ]
+    container_dims = (
+        container["container_x"],
+        container["container_y"],
+        container["container_z"],
+    )
+    return {
+        "shipment_id": f"SHIP-{uuid.uuid4().hex[:8].upper()}",
+        "container": container,
+        "boxes": boxes,
+        "total_boxes": len(boxes),
+        "created_at": datetime.utcnow(),
+        "status": "created",
+        "layout": Optimizer(blocks, container_dims),
+    }
+
+
+def default_layout(shipment):
+    container = shipment["container"]
+    model = ShipmentLayout(
+        container_x=container["container_x"],
+        container_y=container["container_y"],
+        container_z=container["container_z"],
+        layout=shipment["layout"],
+    )
+    return JSONResponse(jsonable_encoder(model)).body
+
+
+def fast_layout(shipment):
+    container = shipment["container"]
+    return encode_json(
+        {
+            "container_x": container["container_x"],
+            "container_y": container["container_y"],
+            "container_z": container["container_z"],
+            "layout": shipment["layout"],
+        }
+    )
+
+
+def default_list(shipments):
+    content = {"shipments": shipments, "count": len(shipments)}
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def fast_list(shipments):
+    return encode_json({"shipments": shipments, "count": len(shipments)})
+
+
+def best_ms(func, arg):
+    times = timeit.repeat(lambda: func(arg), repeat=REPEAT, number=NUMBER)
+    return min(times) / NUMBER * 1000
+
+
+def report(name, default_func, fast_func, arg):
+    default_ms = best_ms(default_func, arg)
+    fast_ms = best_ms(fast_func, arg)
+    body = fast_func(arg)
+
+    print(f"\n{name}")
+    print(f"  default encode: {default_ms:8.3f} ms  {len(default_func(arg)):>9} bytes")
+    print(
+        f"  orjson encode:  {fast_ms:8.3f} ms  {len(body):>9} bytes"
+        f"  ({default_ms / fast_ms:.1f}x faster)"
+    )
+    encodings = ["gzip", "br"] if brotli is not None else ["gzip"]
+    for encoding in encodings:
+        ms = best_ms(lambda b: compress(b, encoding), body)
+        print(f"  + {encoding:<5}         {ms:8.3f} ms  {len(compress(body, encoding)):>9} bytes")
+
+
+def main(paths):
+    shipments = []
+    for path in paths:
+        with open(path) as f:
+            shipment = build_shipment(json.load(f))
+        shipments.append(shipment)
+        report(f"check-shipment ({path})", default_layout, fast_layout, shipment)
+
+    report(f"shipments ({len(shipments)} documents)", default_list, fast_list, shipments)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["sample1.json", "sample2.json"])
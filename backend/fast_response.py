@@ -0,0 +1,86 @@
+import gzip
+import orjson
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are sent as-is; compressing them costs more than it saves
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+
+def encode_json(content):
+    """Encode trusted data (plain lists/dicts, str, numbers, datetime) with orjson"""
+    return orjson.dumps(content)
+
+
+def negotiate_encoding(accept_encoding):
+    """Pick "br", "gzip" or None from an Accept-Encoding header value"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip()] = q
+
+    candidates = ["gzip"]
+    if brotli is not None:
+        candidates.insert(0, "br")
+
+    best, best_q = None, 0.0
+    for coding in candidates:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body, encoding):
+    """Compress an encoded body with the negotiated content coding"""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return body
+
+
+class FastJSONResponse(Response):
+    """JSON response that skips Pydantic/jsonable_encoder and encodes with orjson.
+
+    Only use it for data we already trust (e.g. documents we stored ourselves),
+    since nothing is validated on the way out.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, content, status_code=200, headers=None, accept_encoding=""):
+        body = encode_json(content)
+        headers = dict(headers or {})
+        headers["Vary"] = "Accept-Encoding"
+
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding and len(body) >= MIN_COMPRESS_SIZE:
+            body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+
+        super().__init__(content=body, status_code=status_code, headers=headers)
+
+
+def fast_json_response(request, content, status_code=200):
+    """Build a FastJSONResponse, compressing it if the client allows"""
+    return FastJSONResponse(
+        content,
+        status_code=status_code,
+        accept_encoding=request.headers.get("accept-encoding", ""),
+    )
@@ -9,6 +9,7 @@ from typing import List
 
 ###
 from optimize_packaging import Optimizer, Block
+from fast_response import fast_json_response
 optimized_layout = []
 ###
 
@@ -155,19 +156,26 @@ async def create_shipment(request: ShipmentRequest):
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
-@app.get("/api/check-shipment/{shipment_id}")
-async def get_shipment(shipment_id: str):
+@app.get("/api/check-shipment/{shipment_id}", response_model=ShipmentLayout)
+async def get_shipment(shipment_id: str, request: Request):
     """Get shipment details by shipment ID"""
     try:
-        shipment = collection.find_one({"shipment_id": shipment_id}, {"_id": 0})
+        shipment = collection.find_one(
+            {"shipment_id": shipment_id}, {"_id": 0, "container": 1, "layout": 1}
+        )
 
         if shipment:
             container = shipment.get("container", {})
-            return ShipmentLayout(
-                container_x=container.get("container_x", 0),
-                container_y=container.get("container_y", 0),
-                container_z=container.get("container_z", 0),
-                layout=shipment.get("layout", []),
+            # layout was produced by Optimizer and stored by us, so skip
+            # re-validating it cell by cell and encode it directly
+            return fast_json_response(
+                request,
+                {
+                    "container_x": container.get("container_x", 0),
+                    "container_y": container.get("container_y", 0),
+                    "container_z": container.get("container_z", 0),
+                    "layout": shipment.get("layout", []),
+                },
             )
         else:
             raise HTTPException(status_code=404, detail="Shipment not found")
@@ -178,11 +186,13 @@ async def get_shipment(shipment_id: str):
 
 
 @app.get("/api/shipments")
-async def get_all_shipments():
+async def get_all_shipments(request: Request):
     """Get all shipments"""
     try:
         shipments = list(collection.find({}, {"_id": 0}).sort("created_at", -1))
-        return {"shipments": shipments, "count": len(shipments)}
+        return fast_json_response(
+            request, {"shipments": shipments, "count": len(shipments)}
+        )
 
     except Exception as e:
         print(f"Error fetching shipments: {e}")